@@ -5,13 +5,19 @@ UCI Chess Tournament Framework
 
 import contextlib
 import os
+import queue
 import re
+import selectors
 import shlex
 import signal
 import subprocess
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice, permutations
 from pathlib import Path
 
 try:
@@ -29,6 +35,15 @@ DEFAULT_BOOK_PATH = os.path.join(PROJECT_ROOT, "books", "Titans.bin")
 DEFAULT_ENGINE_LOG_DIR = os.path.join(PROJECT_ROOT, "logs", "engines")
 DEFAULT_TOURNAMENT_THREADS = "8"
 
+# Prefixes of the engine responses we wait for, matched against raw pipe bytes
+_UCIOK = b"uciok"
+_READYOK = b"readyok"
+_BESTMOVE = b"bestmove"
+_INFO = b"info "
+
+# Finished games kept in Tournament.results; older ones live only in the PGN file
+MAX_RETAINED_RESULTS = 1024
+
 
 def _sanitize_filename(name: str) -> str:
     safe = re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("._")
@@ -118,15 +133,31 @@ class Engine:
         use_syzygy: bool = True,
         use_book: bool = True,
         stderr_dir: str | None = DEFAULT_ENGINE_LOG_DIR,
+        use_tournament_threads: bool = True,
     ):
         self.name = name
         self.path = path
+        self._argv = shlex.split(path)
         self.options = options or {}
         self.process = None
         self.stderr_dir = stderr_dir
+        # Apply DEFAULT_TOURNAMENT_THREADS when Threads isn't set; otherwise the
+        # engine keeps its own default
+        self.use_tournament_threads = use_tournament_threads
         self.stderr_log_path: str | None = None
         self._stderr_handle = None
         self._advertised_options: set[str] = set()
+        self._last_opponent: str | None = None
+        # Previous get_move position: FEN, the caller's move list (not copied) and
+        # its length at the time, so appends by the caller don't change the key
+        self._last_position: tuple[str, list[str], int] | None = None
+        # Last "position startpos moves ..." command and the moves it contains
+        self._moves_sent: list[str] = []
+        self._moves_command = "position startpos moves"
+        self._selector: selectors.BaseSelector | None = None
+        self._stdin_fd = -1
+        self._stdout_fd = -1
+        self._buf = bytearray()  # Engine output not yet split into lines
 
         # Auto-enable Syzygy tablebases if available and not already set
         if use_syzygy and "SyzygyPath" not in self.options and os.path.isdir(DEFAULT_SYZYGY_PATH):
@@ -155,14 +186,19 @@ class Engine:
 
         try:
             self.process = subprocess.Popen(
-                shlex.split(self.path),
+                self._argv,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=stderr_target,
-                text=True,
-                bufsize=1,
             )
             assert self.process.stdin is not None and self.process.stdout is not None
+            # Commands and responses go straight through the pipe fds, bypassing
+            # the buffered file objects
+            self._stdin_fd = self.process.stdin.fileno()
+            self._stdout_fd = self.process.stdout.fileno()
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._stdout_fd, selectors.EVENT_READ)
+            self._buf = bytearray()
 
             # Initialize UCI
             self._send("uci")
@@ -171,16 +207,23 @@ class Engine:
             # Set options
             effective_options = dict(self.options)
             if (
-                "Threads" not in effective_options
+                self.use_tournament_threads
+                and "Threads" not in effective_options
                 and "Threads" in self._advertised_options
             ):
                 effective_options["Threads"] = DEFAULT_TOURNAMENT_THREADS
 
-            for key, value in effective_options.items():
-                self._send(f"setoption name {key} value {value}")
-
-            self._send("isready")
-            self._wait_for("readyok")
+            # Send all options plus isready in a single write instead of one flush per line
+            init = [
+                f"setoption name {key} value {value}" for key, value in effective_options.items()
+            ]
+            init.append("isready")
+            self._send("\n".join(init))
+            self._wait_for(_READYOK)
+            self._last_opponent = None
+            self._last_position = None
+            self._moves_sent = []
+            self._moves_command = "position startpos moves"
         except Exception:
             self.stop()
             raise
@@ -190,8 +233,7 @@ class Engine:
         if self.process:
             try:
                 if self.process.poll() is None and self.process.stdin is not None:
-                    self.process.stdin.write("quit\n")
-                    self.process.stdin.flush()
+                    self._write(b"quit\n")
                     self.process.wait(timeout=2)
                 elif self.process.poll() is None:
                     self.process.wait(timeout=2)
@@ -204,11 +246,50 @@ class Engine:
         else:
             self._close_stderr_handle()
 
-    def new_game(self):
-        """Start a new game"""
-        self._send("ucinewgame")
+    def kill(self):
+        """Kill the engine process at once, leaving its pipes for stop() to close.
+
+        Safe to call while another thread is blocked waiting on the engine's output:
+        that wait sees EOF and raises instead of hanging.
+        """
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+
+    def spec(self) -> dict:
+        """Constructor arguments for starting another instance of this engine"""
+        return {
+            "name": self.name,
+            "path": self.path,
+            "options": dict(self.options),
+            "stderr_dir": self.stderr_dir,
+            "use_tournament_threads": self.use_tournament_threads,
+        }
+
+    def new_game(self, keep_hash: bool = False):
+        """Start a new game; keep_hash skips ucinewgame so the hash table survives"""
+        if not keep_hash:
+            self._send("ucinewgame")
+        self._send("isready")
+        self._wait_for(_READYOK)
+
+    def reset(self, opponent: str):
+        """Prepare for a game against opponent, skipping ucinewgame on a rematch"""
+        if opponent != self._last_opponent:
+            self._send("ucinewgame")
+            self._last_opponent = opponent
         self._send("isready")
-        self._wait_for("readyok")
+        self._wait_for(_READYOK)
+
+    def continues_last_search(self, position_fen: str, moves: list[str]) -> bool:
+        """True if this position is one ply past the one given to the previous get_move"""
+        if not moves or self._last_position is None:
+            return False
+        last_fen, last_moves, last_len = self._last_position
+        return (
+            position_fen == last_fen
+            and len(moves) == last_len + 1
+            and moves[:-1] == last_moves[:last_len]
+        )
 
     def get_move(
         self, position_fen: str, moves: list[str], depth: int = 6, movetime: int | None = None
@@ -220,9 +301,18 @@ class Engine:
         elif position_fen != "startpos":
             self._send(f"position fen {position_fen}")
         else:
-            # Fallback: startpos + moves (only used if no FEN available)
-            moves_str = " moves " + " ".join(moves)
-            self._send(f"position startpos{moves_str}")
+            # Fallback: startpos + moves (only used if no FEN available). UCI has no
+            # incremental position command, so the whole history is always sent, but
+            # when the game grew by one ply the previous command is extended rather
+            # than re-joining every move.
+            if len(moves) == len(self._moves_sent) + 1 and moves[:-1] == self._moves_sent:
+                self._moves_command += f" {moves[-1]}"
+                self._moves_sent.append(moves[-1])
+            else:
+                self._moves_command = "position startpos moves " + " ".join(moves)
+                self._moves_sent = list(moves)
+            self._send(self._moves_command)
+        self._last_position = (position_fen, moves, len(moves))
 
         # Request move
         if movetime:
@@ -231,7 +321,7 @@ class Engine:
             self._send(f"go depth {depth}")
 
         # Wait for best move
-        bestmove = self._wait_for("bestmove")
+        bestmove = self._wait_for(_BESTMOVE)
         if bestmove:
             parts = bestmove.split()
             if len(parts) >= 2:
@@ -245,45 +335,75 @@ class Engine:
         if self.process.poll() is not None:
             raise RuntimeError(self._exit_error(f"before receiving '{command}'"))
         try:
-            self.process.stdin.write(command + "\n")
-            self.process.stdin.flush()
+            self._write(command.encode() + b"\n")
         except (BrokenPipeError, OSError) as exc:
             raise RuntimeError(self._exit_error(f"while sending '{command}'")) from exc
 
+    def _write(self, data: bytes):
+        """Write all of data to the engine's stdin fd"""
+        while data:
+            data = data[os.write(self._stdin_fd, data) :]
+
     def _read_uci_options(self, timeout: float = 30.0) -> set[str]:
         """Read UCI handshake output and return advertised option names."""
-        assert self.process is not None and self.process.stdout is not None
         options: set[str] = set()
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
 
-        while time.time() - start_time < timeout:
-            line = self.process.stdout.readline()
-            if line == "" and self.process.poll() is not None:
-                raise RuntimeError(self._exit_error("while waiting for 'uciok'"))
+        while True:
+            line = self._readline(deadline, "while waiting for 'uciok'")
+            if line is None:
+                break
 
-            line = line.strip()
-            if line.startswith("option name "):
-                payload = line[len("option name ") :]
+            if line.startswith(b"option name "):
+                payload = line[len(b"option name ") :].decode(errors="replace")
                 if " type " in payload:
                     options.add(payload.split(" type ", 1)[0])
 
-            if line.startswith("uciok"):
+            if line.startswith(_UCIOK):
                 return options
 
         raise TimeoutError(f"Timed out waiting for 'uciok' from engine '{self.name}'")
 
-    def _wait_for(self, expected: str, timeout: float = 30.0) -> str | None:
-        """Wait for expected response from engine"""
-        assert self.process is not None and self.process.stdout is not None
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            line = self.process.stdout.readline()
-            if line == "" and self.process.poll() is not None:
-                raise RuntimeError(self._exit_error(f"while waiting for '{expected}'"))
-            line = line.strip()
+    def _wait_for(self, expected: bytes, timeout: float = 30.0) -> str | None:
+        """Wait for a line starting with expected and return it decoded"""
+        deadline = time.monotonic() + timeout
+        context = f"while waiting for '{expected.decode()}'"
+        while True:
+            line = self._readline(deadline, context)
+            if line is None:
+                return None
             if line.startswith(expected):
+                return line.decode("ascii")
+
+    def _readline(self, deadline: float, context: str) -> bytes | None:
+        """Return the next stripped raw non-info line, or None once the deadline passes.
+
+        Reads go straight to the stdout fd through a selector so the deadline is
+        enforced even when the engine stops writing mid-line.
+        """
+        assert self.process is not None and self._selector is not None
+        while True:
+            newline = self._buf.find(b"\n")
+            if newline >= 0:
+                # Search info lines are never waited on; drop them without copying
+                if self._buf.startswith(_INFO):
+                    del self._buf[: newline + 1]
+                    continue
+                line = bytes(self._buf[:newline]).strip()
+                del self._buf[: newline + 1]
                 return line
-        return None
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._selector.select(timeout=remaining):
+                return None
+
+            chunk = os.read(self._stdout_fd, 65536)
+            if not chunk:
+                # EOF: give the process a moment to exit so the error has its status
+                with contextlib.suppress(subprocess.TimeoutExpired):
+                    self.process.wait(timeout=1)
+                raise RuntimeError(self._exit_error(context))
+            self._buf += chunk
 
     def _exit_error(self, context: str) -> str:
         assert self.process is not None
@@ -299,6 +419,9 @@ class Engine:
 
     def _close_process(self):
         assert self.process is not None
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
         for stream in (self.process.stdin, self.process.stdout):
             if stream is not None:
                 with contextlib.suppress(OSError):
@@ -313,13 +436,36 @@ class Engine:
             self._stderr_handle = None
 
 
+@contextlib.contextmanager
+def with_engine(name: str, path: str, options: dict[str, str] | None = None, **engine_kwargs):
+    """Yield a started Engine that is stopped on exit, for reuse across many searches"""
+    engine = Engine(name, path, options, **engine_kwargs)
+    engine.start()
+    try:
+        yield engine
+    finally:
+        engine.stop()
+
+
+def _discard(*args, **kwargs):
+    pass
+
+
 class Tournament:
     """Manages tournament between multiple engines"""
 
     def __init__(self, engines: list[Engine]):
         self.engines = engines
-        self.results: list[GameResult] = []
+        # Only recent games are kept in memory; every game is appended to the PGN file
+        self.results: deque[GameResult] = deque(maxlen=MAX_RETAINED_RESULTS)
+        self.pgn_path: str | None = None
+        self._pgn_games = 0
         self.scores: dict[str, float] = {e.name: 0.0 for e in engines}
+        # Running per-engine tallies so standings don't rescan every result
+        self.stats: dict[str, dict[str, int]] = {
+            e.name: {"wins": 0, "draws": 0, "losses": 0, "games": 0} for e in engines
+        }
+        self.draw_reasons: dict[str, int] = {}
 
     def run_round_robin(
         self,
@@ -327,196 +473,322 @@ class Tournament:
         depth: int = 6,
         movetime: int | None = None,
         pgn_file: str | None = None,
+        concurrency: int = 1,
     ):
-        """Run round-robin tournament. If pgn_file is set, saves all games to that file."""
+        """Run round-robin tournament. If pgn_file is set, saves all games to that file.
+
+        With concurrency > 1, games are played in parallel, each with its own
+        engine processes. Use concurrency=0 to size the pool from the CPU count
+        and the engines' Threads option.
+        """
         if not HAS_PYTHON_CHESS:
             print(
                 "WARNING: python-chess not installed — draw adjudication disabled (pip install python-chess)"
             )
 
+        pairings = []
+        for engine1, engine2 in permutations(self.engines, 2):
+            for game in range(games_per_pairing):
+                # Alternate colors
+                if game % 2 == 0:
+                    pairings.append((engine1, engine2))
+                else:
+                    pairings.append((engine2, engine1))
+
+        if concurrency <= 0:
+            concurrency = self._default_concurrency()
+
+        self.pgn_path = pgn_file or self._default_pgn_path()
+        self._pgn_games = 0
+        try:
+            if concurrency > 1:
+                self._run_concurrent(pairings, depth, movetime, concurrency)
+            else:
+                self._run_sequential(pairings, depth, movetime)
+        finally:
+            if self._pgn_games:
+                print(f"\nPGN saved to {self.pgn_path}")
+
+    def _run_sequential(
+        self, pairings: list[tuple[Engine, Engine]], depth: int, movetime: int | None
+    ):
+        """Play all games in this process, reusing one engine process per engine"""
         # Start all engines once for the entire tournament
         for engine in self.engines:
             engine.start()
 
-        total_games = len(self.engines) * (len(self.engines) - 1) * games_per_pairing
-        game_num = 0
-
         try:
-            for i, engine1 in enumerate(self.engines):
-                for j, engine2 in enumerate(self.engines):
-                    if i == j:
-                        continue
-
-                    for game in range(games_per_pairing):
-                        game_num += 1
-                        # Alternate colors
-                        if game % 2 == 0:
-                            white, black = engine1, engine2
-                        else:
-                            white, black = engine2, engine1
-
-                        print(
-                            f"\n[Game {game_num}/{total_games}] {white.name} (White) vs {black.name} (Black)"
-                        )
-                        result = self._play_game(white, black, depth, movetime)
-                        self.results.append(result)
-                        self._update_scores(result)
-                        self._print_standings()
+            for game_num, (white, black) in enumerate(pairings, 1):
+                print(
+                    f"\n[Game {game_num}/{len(pairings)}] {white.name} (White) vs {black.name} (Black)"
+                )
+                result = self._play_game(white, black, depth, movetime)
+                self._record_result(result)
         finally:
             # Stop all engines when tournament is done
             for engine in self.engines:
                 engine.stop()
 
-        # Save PGN
-        pgn_path = pgn_file or self._default_pgn_path()
-        self.save_pgn(pgn_path)
+    def _run_concurrent(
+        self,
+        pairings: list[tuple[Engine, Engine]],
+        depth: int,
+        movetime: int | None,
+        concurrency: int,
+    ):
+        """Play games on a thread pool; scores are updated here as games finish.
+
+        Each running game needs its own engine processes, so engines are copied
+        on demand and returned to an idle pool between games. Engine reads wait
+        in select() with the GIL released, so one interpreter drives every game.
+        """
+        print(f"Running {len(pairings)} games with concurrency {concurrency}")
+        idle: dict[str, queue.SimpleQueue[Engine]] = {
+            e.name: queue.SimpleQueue() for e in self.engines
+        }
+        copies: list[Engine] = []
+        copies_lock = threading.Lock()
+        stopping = False
+
+        def checkout(engine: Engine) -> Engine:
+            with contextlib.suppress(queue.Empty):
+                return idle[engine.name].get_nowait()
+
+            # Spec already carries the resolved SyzygyPath/BookPath options
+            copy = Engine(**engine.spec(), use_syzygy=False, use_book=False)
+            copy.start()
+            with copies_lock:
+                if not stopping:
+                    copies.append(copy)
+                    return copy
+            # The tournament was aborted while this engine was starting
+            copy.stop()
+            raise RuntimeError("Tournament stopped")
+
+        def play(white: Engine, black: Engine) -> GameResult:
+            white_copy = checkout(white)
+            black_copy = checkout(black)
+            result = self._play_game(white_copy, black_copy, depth, movetime, quiet=True)
+            # Engines from a game that raised are not reused; they are stopped below
+            idle[white.name].put(white_copy)
+            idle[black.name].put(black_copy)
+            return result
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            futures = [executor.submit(play, white, black) for white, black in pairings]
+            for game_num, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                print(
+                    f"\n[Game {game_num}/{len(pairings)}] {result.white} (White) vs "
+                    f"{result.black} (Black): {result.result} ({result.reason}, {result.moves} plies)"
+                )
+                self._record_result(result)
+        except BaseException:
+            # Kill every engine first so workers blocked on engine output fail fast
+            # instead of finishing their games; their errors are expected and dropped
+            with copies_lock:
+                stopping = True
+                running = list(copies)
+            for copy in running:
+                copy.kill()
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        finally:
+            executor.shutdown(wait=True)
+            for copy in copies:
+                copy.stop()
+
+    def _default_concurrency(self) -> int:
+        """Number of simultaneous games that keeps every searching thread on its own core"""
+        threads_per_engine = max(
+            int(e.options.get("Threads", DEFAULT_TOURNAMENT_THREADS)) for e in self.engines
+        )
+        return max(1, (os.cpu_count() or 1) // threads_per_engine)
 
     def _play_game(
-        self, white: Engine, black: Engine, depth: int, movetime: int | None
+        self,
+        white: Engine,
+        black: Engine,
+        depth: int,
+        movetime: int | None,
+        quiet: bool = False,
     ) -> GameResult:
-        """Play a single game between two engines (engines must already be started)"""
-        white.new_game()
-        black.new_game()
+        """Play a single game between two engines (engines must already be started).
+
+        quiet suppresses per-move progress, for games running alongside others.
+        """
+        log = _discard if quiet else print
+        white.reset(black.name)
+        black.reset(white.name)
 
         moves = []
         board = chess.Board() if HAS_PYTHON_CHESS else None
         max_moves = 600  # Safety net only — draw rules should trigger first
 
-        try:
-            for move_num in range(max_moves):
-                current_engine = white if move_num % 2 == 0 else black
+        for move_num in range(max_moves):
+            current_engine = white if move_num % 2 == 0 else black
+            # Only need to know whether there are zero, one, or several legal moves
+            legal = list(islice(board.legal_moves, 2)) if board is not None else None
+            if legal is not None and len(legal) < 2:
+                # Forced move or game over: no point asking the engine to search
+                move = legal[0].uci() if legal else None
+            else:
                 # Send FEN when available (avoids replaying entire game each move)
                 current_fen = board.fen() if board is not None else "startpos"
                 move = current_engine.get_move(current_fen, moves, depth, movetime)
 
-                if not move or move == "0000" or move == "(none)":
-                    # Engine returned no move — use board to distinguish checkmate vs stalemate
-                    if board is not None:
-                        if board.is_checkmate():
-                            winner = black.name if move_num % 2 == 0 else white.name
-                            result_str = "0-1" if move_num % 2 == 0 else "1-0"
-                            print(f"  Result: {winner} wins by checkmate")
-                            return GameResult(
-                                white.name,
-                                black.name,
-                                result_str,
-                                len(moves),
-                                "checkmate",
-                                list(moves),
-                            )
-                        elif board.is_stalemate():
-                            print("  Result: Draw (stalemate)")
-                            return GameResult(
-                                white.name,
-                                black.name,
-                                "1/2-1/2",
-                                len(moves),
-                                "stalemate",
-                                list(moves),
-                            )
-
-                    # Fallback without python-chess: assume checkmate
-                    if move_num % 2 == 0:
-                        print(f"  Result: {black.name} wins by checkmate")
-                        return GameResult(
-                            white.name, black.name, "0-1", len(moves), "checkmate", list(moves)
-                        )
-                    else:
-                        print(f"  Result: {white.name} wins by checkmate")
-                        return GameResult(
-                            white.name, black.name, "1-0", len(moves), "checkmate", list(moves)
-                        )
-
-                moves.append(move)
-
-                # Update board for draw detection
+            if not move or move == "0000" or move == "(none)":
+                # No move to play — use board to distinguish checkmate vs stalemate
                 if board is not None:
-                    try:
-                        board.push_uci(move)
-                    except ValueError:
-                        print(
-                            f"  Warning: illegal move '{move}' from {current_engine.name}, ply {len(moves)}"
-                        )
+                    if board.is_checkmate():
                         winner = black.name if move_num % 2 == 0 else white.name
                         result_str = "0-1" if move_num % 2 == 0 else "1-0"
-                        print(f"  Result: {winner} wins by forfeit (illegal move)")
+                        log(f"  Result: {winner} wins by checkmate")
                         return GameResult(
                             white.name,
                             black.name,
                             result_str,
                             len(moves),
-                            f"illegal move: {move}",
-                            list(moves),
-                        )
-
-                    # --- Draw adjudication ---
-                    if board.is_fivefold_repetition():
-                        print(f"  Result: Draw (fivefold repetition) at ply {len(moves)}")
-                        return GameResult(
-                            white.name,
-                            black.name,
-                            "1/2-1/2",
-                            len(moves),
-                            "fivefold repetition",
-                            list(moves),
-                        )
-
-                    if board.is_repetition(3):
-                        print(f"  Result: Draw (threefold repetition) at ply {len(moves)}")
-                        return GameResult(
-                            white.name,
-                            black.name,
-                            "1/2-1/2",
-                            len(moves),
-                            "threefold repetition",
-                            list(moves),
-                        )
-
-                    if board.is_fifty_moves():
-                        print(f"  Result: Draw (50-move rule) at ply {len(moves)}")
-                        return GameResult(
-                            white.name,
-                            black.name,
-                            "1/2-1/2",
-                            len(moves),
-                            "50-move rule",
+                            "checkmate",
                             list(moves),
                         )
-
-                    if board.is_insufficient_material():
-                        print(f"  Result: Draw (insufficient material) at ply {len(moves)}")
+                    elif board.is_stalemate():
+                        log("  Result: Draw (stalemate)")
                         return GameResult(
                             white.name,
                             black.name,
                             "1/2-1/2",
                             len(moves),
-                            "insufficient material",
+                            "stalemate",
                             list(moves),
                         )
 
-                # Print progress every 10 moves
-                if len(moves) % 10 == 0:
-                    print(f"  Move {len(moves)}: {move}")
+                # Fallback without python-chess: assume checkmate
+                if move_num % 2 == 0:
+                    log(f"  Result: {black.name} wins by checkmate")
+                    return GameResult(
+                        white.name, black.name, "0-1", len(moves), "checkmate", list(moves)
+                    )
+                else:
+                    log(f"  Result: {white.name} wins by checkmate")
+                    return GameResult(
+                        white.name, black.name, "1-0", len(moves), "checkmate", list(moves)
+                    )
 
-            # Safety net — should rarely reach here with draw adjudication active
-            result = GameResult(
-                white.name, black.name, "1/2-1/2", len(moves), "max moves", list(moves)
-            )
-            print("  Result: Draw (max moves)")
-            return result
+            moves.append(move)
 
-        finally:
-            pass  # Engines are managed by the tournament, not per-game
+            # Update board for draw detection
+            if board is not None:
+                try:
+                    board.push_uci(move)
+                except ValueError:
+                    log(
+                        f"  Warning: illegal move '{move}' from {current_engine.name}, ply {len(moves)}"
+                    )
+                    winner = black.name if move_num % 2 == 0 else white.name
+                    result_str = "0-1" if move_num % 2 == 0 else "1-0"
+                    log(f"  Result: {winner} wins by forfeit (illegal move)")
+                    return GameResult(
+                        white.name,
+                        black.name,
+                        result_str,
+                        len(moves),
+                        f"illegal move: {move}",
+                        list(moves),
+                    )
+
+                # --- Draw adjudication ---
+                if board.is_fivefold_repetition():
+                    log(f"  Result: Draw (fivefold repetition) at ply {len(moves)}")
+                    return GameResult(
+                        white.name,
+                        black.name,
+                        "1/2-1/2",
+                        len(moves),
+                        "fivefold repetition",
+                        list(moves),
+                    )
+
+                if board.is_repetition(3):
+                    log(f"  Result: Draw (threefold repetition) at ply {len(moves)}")
+                    return GameResult(
+                        white.name,
+                        black.name,
+                        "1/2-1/2",
+                        len(moves),
+                        "threefold repetition",
+                        list(moves),
+                    )
+
+                if board.is_fifty_moves():
+                    log(f"  Result: Draw (50-move rule) at ply {len(moves)}")
+                    return GameResult(
+                        white.name,
+                        black.name,
+                        "1/2-1/2",
+                        len(moves),
+                        "50-move rule",
+                        list(moves),
+                    )
+
+                if board.is_insufficient_material():
+                    log(f"  Result: Draw (insufficient material) at ply {len(moves)}")
+                    return GameResult(
+                        white.name,
+                        black.name,
+                        "1/2-1/2",
+                        len(moves),
+                        "insufficient material",
+                        list(moves),
+                    )
+
+            # Print progress every 10 moves
+            if len(moves) % 10 == 0:
+                log(f"  Move {len(moves)}: {move}")
+
+        # Safety net — should rarely reach here with draw adjudication active
+        result = GameResult(white.name, black.name, "1/2-1/2", len(moves), "max moves", list(moves))
+        log("  Result: Draw (max moves)")
+        return result
+
+    def _record_result(self, result: GameResult):
+        """Score a finished game, append it to the PGN file, and print standings"""
+        self.results.append(result)
+        self._update_scores(result)
+        self._append_pgn(result)
+        self._print_standings()
+
+    def _append_pgn(self, result: GameResult):
+        """Append one game to the tournament PGN file, replacing any old file on the first game"""
+        assert self.pgn_path is not None
+        self._pgn_games += 1
+        if self._pgn_games == 1:
+            os.makedirs(os.path.dirname(self.pgn_path) or ".", exist_ok=True)
+        with open(self.pgn_path, "w" if self._pgn_games == 1 else "a") as f:
+            f.write(result.to_pgn(round_num=self._pgn_games))
+            f.write("\n")
 
     def _update_scores(self, result: GameResult):
-        """Update tournament scores"""
+        """Update tournament scores and per-engine stats"""
+        white, black = self.stats[result.white], self.stats[result.black]
+        white["games"] += 1
+        black["games"] += 1
+
         if result.result == "1-0":
             self.scores[result.white] += 1.0
+            white["wins"] += 1
+            black["losses"] += 1
         elif result.result == "0-1":
             self.scores[result.black] += 1.0
+            white["losses"] += 1
+            black["wins"] += 1
         elif result.result == "1/2-1/2":
             self.scores[result.white] += 0.5
             self.scores[result.black] += 0.5
+            white["draws"] += 1
+            black["draws"] += 1
+            self.draw_reasons[result.reason] = self.draw_reasons.get(result.reason, 0) + 1
 
     def _print_standings(self):
         """Print current tournament standings"""
@@ -526,29 +798,16 @@ class Tournament:
         sorted_scores = sorted(self.scores.items(), key=lambda x: x[1], reverse=True)
 
         for name, score in sorted_scores:
-            games_played = sum(1 for r in self.results if r.white == name or r.black == name)
-            wins = sum(
-                1
-                for r in self.results
-                if (r.white == name and r.result == "1-0")
-                or (r.black == name and r.result == "0-1")
-            )
-            draws = sum(
-                1
-                for r in self.results
-                if (r.white == name or r.black == name) and r.result == "1/2-1/2"
+            stats = self.stats[name]
+            print(
+                f"{name:40s} {score:5.1f} (+{stats['wins']} ={stats['draws']} -{stats['losses']})"
             )
-            losses = games_played - wins - draws
-
-            print(f"{name:40s} {score:5.1f} (+{wins} ={draws} -{losses})")
 
         # Draw reason breakdown
-        draw_results = [r for r in self.results if r.result == "1/2-1/2"]
-        if draw_results:
-            reasons = {}
-            for r in draw_results:
-                reasons[r.reason] = reasons.get(r.reason, 0) + 1
-            reason_parts = [f"{reason}: {count}" for reason, count in sorted(reasons.items())]
+        if self.draw_reasons:
+            reason_parts = [
+                f"{reason}: {count}" for reason, count in sorted(self.draw_reasons.items())
+            ]
             print(f"  Draws: {', '.join(reason_parts)}")
         print("=" * 60)
 
@@ -559,7 +818,7 @@ class Tournament:
         return os.path.join(PROJECT_ROOT, "games", f"{names}_{ts}.pgn")
 
     def save_pgn(self, path: str):
-        """Save all games to a PGN file"""
+        """Save the most recent games (up to MAX_RETAINED_RESULTS) to a PGN file"""
         if not self.results:
             return
         os.makedirs(os.path.dirname(path), exist_ok=True)
@@ -3,8 +3,11 @@
 Watch a single game move-by-move and output in PGN format
 """
 
+import contextlib
 import os
+import shlex
 import subprocess
+import sys
 from datetime import datetime
 
 try:
@@ -26,35 +29,23 @@ DEFAULT_BOOK_PATH = os.path.join(PROJECT_ROOT, "books", "Titans.bin")
 def create_engine(path, options=None):
     """Create and initialize a UCI engine"""
     proc = subprocess.Popen(
-        path,
-        shell=True,
+        shlex.split(path),
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1,
+        stderr=subprocess.DEVNULL,
     )
     assert proc.stdin is not None and proc.stdout is not None
 
-    # Initialize
-    proc.stdin.write("uci\n")
-    proc.stdin.flush()
-    while True:
-        line = proc.stdout.readline().strip()
-        if line.startswith("uciok"):
-            break
-
-    # Set options
+    # Initialize and set options in one write; uciok/id/option lines are skipped below
+    init = "uci\n"
     if options:
-        for key, value in options.items():
-            proc.stdin.write(f"setoption name {key} value {value}\n")
-            proc.stdin.flush()
-
-    proc.stdin.write("isready\n")
+        init += "".join(f"setoption name {key} value {value}\n" for key, value in options.items())
+    init += "isready\n"
+    proc.stdin.write(init.encode())
     proc.stdin.flush()
     while True:
         line = proc.stdout.readline().strip()
-        if line.startswith("readyok"):
+        if line.startswith(b"readyok"):
             break
 
     return proc
@@ -65,18 +56,18 @@ def get_move(proc, position, moves, depth):
     # Send position
     moves_str = " moves " + " ".join(moves) if moves else ""
 
-    proc.stdin.write(f"position {position}{moves_str}\n")
+    proc.stdin.write(f"position {position}{moves_str}\n".encode())
     proc.stdin.flush()
 
     # Request move
-    proc.stdin.write(f"go depth {depth}\n")
+    proc.stdin.write(f"go depth {depth}\n".encode())
     proc.stdin.flush()
 
     # Wait for bestmove
     while True:
         line = proc.stdout.readline().strip()
-        if line.startswith("bestmove"):
-            return line.split()[1]
+        if line.startswith(b"bestmove"):
+            return line.split()[1].decode("ascii")
 
 
 def uci_to_san(board, uci_move):
@@ -95,16 +86,17 @@ def uci_to_san(board, uci_move):
 
 def play_game():
     """Play one game and output in PGN format"""
-    # PGN Header
-    date = datetime.now()
-    print('[Event "Chess++ vs Stockfish"]')
-    print('[Site "Local Engine Match"]')
-    print(f'[Date "{date.strftime("%Y.%m.%d")}"]')
-    print('[Round "1"]')
-    print('[White "Chess++ v2.0"]')
-    print('[Black "Stockfish Level-1"]')
-    print('[Result "*"]')
-    print()
+    # PGN Header, written in one go
+    sys.stdout.write(
+        '[Event "Chess++ vs Stockfish"]\n'
+        '[Site "Local Engine Match"]\n'
+        f'[Date "{datetime.now():%Y.%m.%d}"]\n'
+        '[Round "1"]\n'
+        '[White "Chess++ v2.0"]\n'
+        '[Black "Stockfish Level-1"]\n'
+        '[Result "*"]\n'
+        "\n"
+    )
 
     # Create engines with Polyglot book if available
     chesscpp_options = {"Depth": "8"}
@@ -117,18 +109,15 @@ def play_game():
     assert chesscpp.stdin is not None and stockfish.stdin is not None
 
     # Start game
-    chesscpp.stdin.write("ucinewgame\n")
+    chesscpp.stdin.write(b"ucinewgame\n")
     chesscpp.stdin.flush()
-    stockfish.stdin.write("ucinewgame\n")
+    stockfish.stdin.write(b"ucinewgame\n")
     stockfish.stdin.flush()
 
     moves = []
     max_moves = 200
     result = "*"
 
-    if HAS_CHESS:
-        board = chess.Board()  # type: ignore[possibly-undefined]
-
     # Play the game
     for move_num in range(max_moves):
         # White's turn (Chess++)
@@ -152,28 +141,15 @@ def play_game():
             break
 
     # Output movetext in PGN format
+    movetext = None
     if HAS_CHESS:
-        board = chess.Board()  # type: ignore[possibly-undefined]
-        output = []
-        for i, uci_move in enumerate(moves):
-            try:
-                move = chess.Move.from_uci(uci_move)  # type: ignore[possibly-undefined]
-                san = board.san(move)
-                board.push(move)
-
-                if i % 2 == 0:
-                    output.append(f"{i // 2 + 1}. {san}")
-                else:
-                    output[-1] += f" {san}"
-            except Exception:
-                # Fallback to UCI notation
-                if i % 2 == 0:
-                    output.append(f"{i // 2 + 1}. {uci_move}")
-                else:
-                    output[-1] += f" {uci_move}"
-
-        print(" ".join(output))
-    else:
+        # Illegal or malformed moves fall through to the UCI notation below
+        with contextlib.suppress(ValueError):
+            movetext = chess.Board().variation_san(  # type: ignore[possibly-undefined]
+                [chess.Move.from_uci(m) for m in moves]  # type: ignore[possibly-undefined]
+            )
+
+    if movetext is None:
         # Fallback: output UCI moves in PGN-like format
         output = []
         for i, uci_move in enumerate(moves):
@@ -181,15 +157,14 @@ def play_game():
                 output.append(f"{i // 2 + 1}. {uci_move}")
             else:
                 output[-1] += f" {uci_move}"
-        print(" ".join(output))
+        movetext = " ".join(output)
 
-    print(f" {result}")
-    print()
+    sys.stdout.write(f"{movetext}\n {result}\n\n")
 
     # Cleanup
-    chesscpp.stdin.write("quit\n")
+    chesscpp.stdin.write(b"quit\n")
     chesscpp.stdin.flush()
-    stockfish.stdin.write("quit\n")
+    stockfish.stdin.write(b"quit\n")
     stockfish.stdin.flush()
     chesscpp.wait(timeout=2)
     stockfish.wait(timeout=2)